@@ -1,5 +1,3 @@
-import copy
-
 from ayon_core import resources
 from ayon_core.lib import (
     Logger,
@@ -51,6 +49,15 @@ class ApplicationAction(LauncherAction):
     project_entities_cache = NestedCacheItem(
         levels=1, default_factory=dict, lifetime=20
     )
+    # Applications available for last selection, 'is_compatible' is called
+    #   for each application action with the same selection
+    # - stores source objects used to get the applications, to recalculate
+    #   them when any of them changes
+    # - sources are compared by identity, which is safe because the cache
+    #   keeps references to them (their ids can't be reused), they are only
+    #   read, and changed settings or entities are always new objects
+    #   (launcher refresh or expired settings cache)
+    _applications_cache = None
 
     @classmethod
     def _app_get_project_settings(cls, selection):
@@ -68,7 +75,37 @@ class ApplicationAction(LauncherAction):
             else:
                 settings = get_studio_settings()
             cache.update_data(settings)
-        return copy.deepcopy(cache.get_data())
+        # Settings are only read by the action, so cached data can be
+        #   returned without copy
+        return cache.get_data()
+
+    @classmethod
+    def _app_get_applications(cls, selection, project_settings):
+        sources = (
+            project_settings,
+            selection.get_project_entity(),
+            selection.get_folder_entity(),
+            selection.get_task_entity(),
+        )
+        cache = ApplicationAction._applications_cache
+        if cache is not None:
+            cached_sources, applications = cache
+            if all(
+                cached is source
+                for cached, source in zip(cached_sources, sources)
+            ):
+                return applications
+
+        project_entity, folder_entity, task_entity = sources[1:]
+        applications = get_applications_for_context(
+            selection.project_name,
+            folder_entity,
+            task_entity,
+            project_settings=project_settings,
+            project_entity=project_entity,
+        )
+        ApplicationAction._applications_cache = (sources, applications)
+        return applications
 
     @property
     def log(self):
@@ -81,13 +118,7 @@ class ApplicationAction(LauncherAction):
             return False
 
         project_settings = self._app_get_project_settings(selection)
-        apps = get_applications_for_context(
-            selection.project_name,
-            selection.get_folder_entity(),
-            selection.get_task_entity(),
-            project_settings=project_settings,
-            project_entity=selection.get_project_entity(),
-        )
+        apps = self._app_get_applications(selection, project_settings)
         if self.application.full_name not in apps:
             return False
 
@@ -2,7 +2,7 @@ import os
 
 APPLICATIONS_ADDON_ROOT = os.path.dirname(os.path.abspath(__file__))
 
-PLATFORM_NAMES = {"windows", "linux", "darwin"}
+PLATFORM_NAMES = frozenset({"windows", "linux", "darwin"})
 DEFAULT_ENV_SUBGROUP = "standard"
 
 LABELS_BY_GROUP_NAME = {
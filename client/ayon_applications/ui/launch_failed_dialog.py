@@ -93,9 +93,9 @@ class ErrorDialog(QtWidgets.QDialog):
         self._detail = detail
 
         self.set_message(message, detail)
+        self.setStyleSheet(load_stylesheet())
 
     def showEvent(self, event):
-        self.setStyleSheet(load_stylesheet())
         self.resize(430, 180)
         super().showEvent(event)
 
@@ -1,10 +1,9 @@
 import os
-import copy
 import json
+import logging
 import platform
-import collections
+import weakref
 
-import six
 import acre
 import ayon_api
 
@@ -29,6 +28,17 @@ from .constants import (
 from .exceptions import MissingRequiredKey, ApplicationLaunchFailed
 from .manager import ApplicationManager
 
+_CURRENT_PLATFORM = platform.system().lower()
+_PYTHON_VENDOR_DIR = os.path.join(AYON_CORE_ROOT, "vendor", "python")
+_PYTHON_2_VENDOR_DIR = os.path.join(_PYTHON_VENDOR_DIR, "python_2")
+_PYTHON_3_VENDOR_DIR = os.path.join(_PYTHON_VENDOR_DIR, "python_3")
+# Vendor directories are part of ayon-core and don't change during process
+_PYTHON_2_VENDOR_EXISTS = os.path.exists(_PYTHON_2_VENDOR_DIR)
+_PYTHON_3_VENDOR_EXISTS = os.path.exists(_PYTHON_3_VENDOR_DIR)
+_ICONS_DIR = os.path.join(APPLICATIONS_ADDON_ROOT, "icons")
+# Addons implementing 'modify_application_launch_arguments' by addons manager
+_LAUNCH_ARGS_ADDONS_CACHE = weakref.WeakKeyDictionary()
+
 
 def parse_environments(env_data, env_group=None, platform_name=None):
     """Parse environment values from settings byt group and platform.
@@ -85,35 +95,45 @@ def parse_environments(env_data, env_group=None, platform_name=None):
     if not env_data:
         return output
 
+    # Flat environments without groups and platform specific values
+    if all(type(value) is str for value in env_data.values()):
+        return dict(env_data)
+
     if not env_group:
         env_group = DEFAULT_ENV_SUBGROUP
 
     if not platform_name:
-        platform_name = platform.system().lower()
+        platform_name = _CURRENT_PLATFORM
 
+    pathsep = os.pathsep
+    # Values are loaded from json so exact type checks are enough
     for key, value in env_data.items():
-        if isinstance(value, dict):
+        value_type = type(value)
+        if value_type is dict:
             # Look if any key is platform key
             #   - expect that represents environment group if does not contain
             #   platform keys
-            if not PLATFORM_NAMES.intersection(set(value.keys())):
+            if PLATFORM_NAMES.isdisjoint(value):
                 # Skip the key if group is not available
                 if env_group not in value:
                     continue
                 value = value[env_group]
+                value_type = type(value)
 
-        # Check again if value is dictionary
-        #   - this time there should be only platform keys
-        if isinstance(value, dict):
-            value = value.get(platform_name)
+            # Check again if value is dictionary
+            #   - this time there should be only platform keys
+            if value_type is dict:
+                value = value.get(platform_name)
+                value_type = type(value)
 
         # Check if value is list and join it's values
         # QUESTION Should empty values be skipped?
-        if isinstance(value, (list, tuple)):
-            value = os.pathsep.join(value)
+        if value_type is list or value_type is tuple:
+            value = pathsep.join(value)
+            value_type = str
 
         # Set key to output if value is string
-        if isinstance(value, six.string_types):
+        if value_type is str:
             output[key] = value
     return output
 
@@ -203,29 +223,60 @@ def _merge_env(env, current_env):
     return result
 
 
+def _update_env(env, current_env):
+    """Merge 'env' into 'current_env' in place.
+
+    Same as '_merge_env' but does not copy 'current_env'.
+    """
+    current_env.update({
+        key: acre.lib.partial_format(value, data=current_env)
+        for key, value in env.items()
+    })
+
+
+def _get_launch_args_addons(addons_manager):
+    """Get enabled addons that can modify application launch arguments.
+
+    Enabled addons don't change during lifetime of addons manager so the
+    result is cached per addons manager.
+
+    Args:
+        addons_manager (AddonsManager): Addons manager.
+
+    Returns:
+        list[AYONAddon]: Addons with 'modify_application_launch_arguments'.
+
+    """
+    addons = _LAUNCH_ARGS_ADDONS_CACHE.get(addons_manager)
+    if addons is None:
+        addons = [
+            addon
+            for addon in addons_manager.get_enabled_addons()
+            if hasattr(addon, "modify_application_launch_arguments")
+        ]
+        _LAUNCH_ARGS_ADDONS_CACHE[addons_manager] = addons
+    return addons
+
+
 def _add_python_version_paths(app, env, logger, addons_manager):
     """Add vendor packages specific for a Python version."""
 
-    for addon in addons_manager.get_enabled_addons():
-        if hasattr(addon, "modify_application_launch_arguments"):
-            addon.modify_application_launch_arguments(app, env)
+    for addon in _get_launch_args_addons(addons_manager):
+        addon.modify_application_launch_arguments(app, env)
 
     # Skip adding if host name is not set
     if not app.host_name:
         return
 
     # Add Python 2/3 modules
-    python_vendor_dir = os.path.join(
-        AYON_CORE_ROOT,
-        "vendor",
-        "python"
-    )
     if app.use_python_2:
-        pythonpath = os.path.join(python_vendor_dir, "python_2")
+        pythonpath = _PYTHON_2_VENDOR_DIR
+        pythonpath_exists = _PYTHON_2_VENDOR_EXISTS
     else:
-        pythonpath = os.path.join(python_vendor_dir, "python_3")
+        pythonpath = _PYTHON_3_VENDOR_DIR
+        pythonpath_exists = _PYTHON_3_VENDOR_EXISTS
 
-    if not os.path.exists(pythonpath):
+    if not pythonpath_exists:
         return
 
     logger.debug("Adding Python version specific paths to PYTHONPATH")
@@ -250,16 +301,17 @@ def _get_app_full_names_from_settings(applications_settings):
         List[str]: Full names of applications.
 
     """
-    apps = copy.deepcopy(applications_settings["applications"])
-    additional_apps = apps.pop("additional_apps")
+    apps = applications_settings["applications"]
 
     full_names = []
     for group_name, group_info in apps.items():
+        if group_name == "additional_apps":
+            continue
         for variant in group_info["variants"]:
             variant_name = variant["name"]
             full_names.append(f"{group_name}/{variant_name}")
 
-    for additional_app in additional_apps:
+    for additional_app in apps["additional_apps"]:
         group_name = additional_app["name"]
         for variant in additional_app["variants"]:
             variant_name = variant["name"]
@@ -422,33 +474,38 @@ def prepare_app_environments(
         data.get("project_name"),
         data.get("folder_entity"),
         data.get("task_entity"),
+        project_settings=data.get("project_settings"),
     )
 
     # Add tools environments
-    groups_by_name = {}
-    tool_by_group_name = collections.defaultdict(dict)
-    for key in tools:
-        tool = app.manager.tools.get(key)
-        if not tool or not tool.is_valid_for_app(app):
-            continue
-        groups_by_name[tool.group.name] = tool.group
-        tool_by_group_name[tool.group.name][tool.name] = tool
-
-    for group_name in sorted(groups_by_name.keys()):
-        group = groups_by_name[group_name]
-        environments.append(group.environment)
-        for tool_name in sorted(tool_by_group_name[group_name].keys()):
-            tool = tool_by_group_name[group_name][tool_name]
+    if tools:
+        tools_by_name = app.manager.tools
+        tools_by_sort_key = {}
+        for key in tools:
+            tool = tools_by_name.get(key)
+            if not tool or not tool.is_valid_for_app(app):
+                continue
+            tools_by_sort_key[(tool.group.name, tool.name)] = tool
+
+        # Sort tools by group name and tool name, group environment is added
+        #   before environments of its tools
+        last_group_name = None
+        for sort_key, tool in sorted(tools_by_sort_key.items()):
+            group_name = sort_key[0]
+            if group_name != last_group_name:
+                environments.append(tool.group.environment)
+                last_group_name = group_name
             environments.append(tool.environment)
             app_and_tool_labels.append(tool.full_name)
 
-    log.info(
-        "Will add environments for apps and tools: {}".format(
-            ", ".join(app_and_tool_labels)
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "Will add environments for apps and tools: {}".format(
+                ", ".join(app_and_tool_labels)
+            )
         )
-    )
 
-    env_values = {}
+    merged_env = source_env.copy()
     for _env_values in environments:
         if not _env_values:
             continue
@@ -464,13 +521,10 @@ def prepare_app_environments(
                 tool_env[key] = value
 
         # Merge dictionaries
-        env_values = _merge_env(tool_env, env_values)
-
-    merged_env = _merge_env(env_values, source_env)
+        _update_env(tool_env, merged_env)
 
-    loaded_env = acre.compute(merged_env, cleanup=False)
+    final_env = acre.compute(merged_env, cleanup=False)
 
-    final_env = None
     # Add host specific environments
     if app.host_name and implementation_envs:
         host_addon = addons_manager.get_host_addon(app.host_name)
@@ -481,12 +535,13 @@ def prepare_app_environments(
             )
         if add_implementation_envs:
             # Function may only modify passed dict without returning value
-            final_env = add_implementation_envs(loaded_env, app)
+            implementation_env = add_implementation_envs(final_env, app)
+            if implementation_env is not None:
+                final_env = implementation_env
 
-    if final_env is None:
-        final_env = loaded_env
-
-    keys_to_remove = set(source_env.keys()) - set(final_env.keys())
+    # NOTE 'data["env"]' must be updated in place, it is shared with
+    #   launch context and prelaunch hooks
+    keys_to_remove = source_env.keys() - final_env.keys()
 
     # Update env
     data["env"].update(final_env)
@@ -555,8 +610,11 @@ def prepare_context_environments(data, env_group=None, addons_manager=None):
 
     # Load project specific environments
     project_name = project_entity["name"]
-    project_settings = get_project_settings(project_name)
-    data["project_settings"] = project_settings
+    # Reuse project settings loaded by 'EnvironmentPrepData'
+    project_settings = data.get("project_settings")
+    if project_settings is None:
+        project_settings = get_project_settings(project_name)
+        data["project_settings"] = project_settings
 
     app = data["app"]
     context_env = {
@@ -570,11 +628,12 @@ def prepare_context_environments(data, env_group=None, addons_manager=None):
         if task_entity:
             context_env["AYON_TASK_NAME"] = task_entity["name"]
 
-    log.debug(
-        "Context environments set:\n{}".format(
-            json.dumps(context_env, indent=4)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "Context environments set:\n{}".format(
+                json.dumps(context_env, indent=4)
+            )
         )
-    )
     data["env"].update(context_env)
 
     # Apply project specific environments on current env value
@@ -669,7 +728,8 @@ def _prepare_last_workfile(data, workdir, addons_manager):
         return
 
     app = data["app"]
-    workdir_data = copy.deepcopy(_workdir_data)
+    # Only top level keys are changed so shallow copy is enough
+    workdir_data = _workdir_data.copy()
     project_name = data["project_name"]
     task_name = data["task_name"]
     task_type = data["task_type"]
@@ -713,7 +773,6 @@ def _prepare_last_workfile(data, workdir, addons_manager):
         if extensions:
             anatomy = data["anatomy"]
             project_settings = data["project_settings"]
-            task_type = workdir_data["task"]["type"]
             template_key = get_workfile_template_key(
                 project_name,
                 task_type,
@@ -735,7 +794,11 @@ def _prepare_last_workfile(data, workdir, addons_manager):
                 workdir, file_template, workdir_data, extensions, True
             )
 
-    if not os.path.exists(last_workfile_path):
+    # Check of path existence is used only for debug message
+    if (
+        log.isEnabledFor(logging.DEBUG)
+        and not os.path.exists(last_workfile_path)
+    ):
         log.debug((
             "Workfiles for launch context does not exists"
             " yet but path will be set."
@@ -761,7 +824,7 @@ def get_app_icon_path(icon_filename):
     if not icon_filename:
         return None
     icon_name = os.path.basename(icon_filename)
-    path = os.path.join(APPLICATIONS_ADDON_ROOT, "icons", icon_name)
-    if os.path.exists(path):
+    path = os.path.join(_ICONS_DIR, icon_name)
+    if os.path.isfile(path):
         return path
     return None
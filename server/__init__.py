@@ -22,6 +22,8 @@ have to find some clever way how to avoid the issues.
 Version stored under 'ATTRIBUTES_VERSION_MILESTONE' should be last released
 version that used only old attribute system.
 """
+import asyncio
+import functools
 from typing import Any
 from typing import TYPE_CHECKING
 
@@ -39,15 +41,23 @@ if TYPE_CHECKING:
     )
 
 from .constants import LABELS_BY_GROUP_NAME
-from .settings import ApplicationsAddonSettings, DEFAULT_VALUES
+from .settings import (
+    ApplicationsAddonSettings,
+    DEFAULT_VALUES,
+    iter_app_groups,
+)
 from .actions import (
     get_action_manifests,
     IDENTIFIER_PREFIX,
 )
 
 ATTRIBUTES_VERSION_MILESTONE = (1, 0, 0)
+# Used to compare scope of existing attributes
+APPS_SCOPE_SET = frozenset({"project"})
+TOOLS_SCOPE_SET = frozenset({"project", "folder", "task"})
 
 
+@functools.lru_cache(maxsize=None)
 def parse_version(version):
     try:
         return semver.VersionInfo.parse(version)
@@ -89,7 +99,7 @@ class ApplicationsAddon(BaseServerAddon):
         executor: "ActionExecutor",
     ) -> "ExecuteResponseModel":
         """Execute an action provided by the addon"""
-        app_name = executor.identifier[len(IDENTIFIER_PREFIX):]
+        app_name = executor.identifier.removeprefix(IDENTIFIER_PREFIX)
         context = executor.context
         project_name = context.project_name
         task_id = context.entity_ids[0]
@@ -154,44 +164,47 @@ class ApplicationsAddon(BaseServerAddon):
     # --------------------------------------
     def _sort_versions(self, addon_versions, reverse=False):
         version_objs, invalid_versions = parse_versions(addon_versions)
+        version_objs.sort(key=lambda x: x[1])
+        invalid_versions.sort()
 
-        valid_versions = [
-            addon_version
-            for addon_version, version_obj in (
-                sorted(version_objs, key=lambda x: x[1])
-            )
+        sorted_versions = [
+            (addon_version, None)
+            for addon_version in invalid_versions
         ]
-        sorted_versions = list(sorted(invalid_versions)) + valid_versions
+        sorted_versions.extend(version_objs)
         if reverse:
-            sorted_versions = reversed(sorted_versions)
-        for addon_version in sorted_versions:
-            yield addon_version
-
-    def _merge_groups(self, output, new_groups):
-        groups_by_name = {
-            o_group["name"]: o_group
-            for o_group in output
-        }
-        extend_groups = []
+            sorted_versions.reverse()
+        return sorted_versions
+
+    def _merge_groups(self, groups_index, new_groups):
+        """Merge groups into index of already collected groups.
+
+        Index is filled during whole enums update, it contains group by
+        its name with set of its variant names. Variants with already
+        used names are skipped, also within a newly added group.
+        """
         for new_group in new_groups:
             group_name = new_group["name"]
-            if group_name not in groups_by_name:
-                extend_groups.append(new_group)
-                continue
-            existing_group = groups_by_name[group_name]
+            index_item = groups_index.get(group_name)
+            if index_item is None:
+                # Store copy of the group with own variants list
+                existing_group = {**new_group, "variants": []}
+                variant_names = set()
+                groups_index[group_name] = (existing_group, variant_names)
+            else:
+                existing_group, variant_names = index_item
+
             existing_variants = existing_group["variants"]
-            existing_variants_by_name = {
-                variant["name"]: variant
-                for variant in existing_variants
-            }
             for new_variant in new_group["variants"]:
-                if new_variant["name"] not in existing_variants_by_name:
+                variant_name = new_variant["name"]
+                if variant_name not in variant_names:
+                    variant_names.add(variant_name)
                     existing_variants.append(new_variant)
 
-        output.extend(extend_groups)
-
     def _get_enum_items_from_groups(self, groups):
-        label_by_name = {}
+        # Groups were merged by '_merge_groups' which keeps group and
+        #   variant names unique, so items don't have to be deduplicated
+        items = []
         for group in groups:
             group_name = group["name"]
             group_label = group.get(
@@ -202,17 +215,18 @@ class ApplicationsAddon(BaseServerAddon):
                 if not variant_name:
                     continue
                 variant_label = variant["label"] or variant_name
-                full_name = f"{group_name}/{variant_name}"
-                full_label = f"{group_label} {variant_label}"
-                label_by_name[full_name] = full_label
+                items.append((
+                    f"{group_name}/{variant_name}",
+                    f"{group_label} {variant_label}",
+                ))
 
+        items.sort()
         return [
-            {"value": full_name, "label": label_by_name[full_name]}
-            for full_name in sorted(label_by_name)
+            {"value": full_name, "label": full_label}
+            for full_name, full_label in items
         ]
 
-    def _addon_has_attributes(self, addon, addon_version):
-        version_obj = parse_version(addon_version)
+    def _addon_has_attributes(self, addon, version_obj):
         if version_obj is None or version_obj < ATTRIBUTES_VERSION_MILESTONE:
             return True
 
@@ -227,25 +241,38 @@ class ApplicationsAddon(BaseServerAddon):
 
         instance = AddonLibrary.getinstance()
         app_defs = instance.data.get(self.name)
-        all_applications = []
-        all_tools = []
-        for addon_version in self._sort_versions(
+        addons = []
+        for addon_version, version_obj in self._sort_versions(
             app_defs.versions.keys(), reverse=True
         ):
             addon = app_defs.versions[addon_version]
-            if not self._addon_has_attributes(addon, addon_version):
-                continue
-
-            for variant in ("production", "staging"):
-                settings_model = await addon.get_studio_settings(variant)
-                studio_settings = settings_model.dict()
-                application_settings = studio_settings["applications"]
-                app_groups = application_settings.pop("additional_apps")
-                for group_name, value in application_settings.items():
-                    value["name"] = group_name
-                    app_groups.append(value)
-                self._merge_groups(all_applications, app_groups)
-                self._merge_groups(all_tools, studio_settings["tool_groups"])
+            if self._addon_has_attributes(addon, version_obj):
+                addons.append(addon)
+
+        # Nothing to do when no addon version uses the attributes
+        if not addons:
+            return
+
+        # Fetch settings concurrently, order of results is kept so newer
+        #   addon versions are still merged first
+        settings_models = await asyncio.gather(*(
+            addon.get_studio_settings(variant)
+            for addon in addons
+            for variant in ("production", "staging")
+        ))
+
+        applications_index = {}
+        tools_index = {}
+        for settings_model in settings_models:
+            studio_settings = settings_model.dict()
+            self._merge_groups(
+                applications_index,
+                iter_app_groups(studio_settings["applications"])
+            )
+            self._merge_groups(tools_index, studio_settings["tool_groups"])
+
+        all_applications = [group for group, _ in applications_index.values()]
+        all_tools = [group for group, _ in tools_index.values()]
 
         apps_attrib_name = "applications"
         tools_attrib_name = "tools"
@@ -270,20 +297,25 @@ class ApplicationsAddon(BaseServerAddon):
         apps_matches = False
         tools_matches = False
 
-        async for row in Postgres.iterate(
-            "SELECT name, position, scope, data from public.attributes"
+        for row in await Postgres.fetch(
+            """
+            SELECT name, scope, data
+            FROM public.attributes
+            WHERE name = ANY($1)
+            """,
+            [apps_attrib_name, tools_attrib_name],
         ):
             if row["name"] == apps_attrib_name:
                 # Check if scope is matching ftrack addon requirements
                 if (
-                    set(row["scope"]) == set(apps_scope)
+                    set(row["scope"]) == APPS_SCOPE_SET
                     and row["data"].get("enum") == apps_enum
                 ):
                     apps_matches = True
 
             elif row["name"] == tools_attrib_name:
                 if (
-                    set(row["scope"]) == set(tools_scope)
+                    set(row["scope"]) == TOOLS_SCOPE_SET
                     and row["data"].get("enum") == tools_enum
                 ):
                     tools_matches = True
@@ -291,33 +323,43 @@ class ApplicationsAddon(BaseServerAddon):
         if apps_matches and tools_matches:
             return
 
+        changed_attributes = []
         if not apps_matches:
-            await Postgres.execute(
-                """
-                UPDATE attributes SET
-                    scope = $1,
-                    data = $2
-                WHERE
-                    name = $3
-                """,
-                apps_scope,
-                apps_attribute_data,
-                apps_attrib_name,
+            changed_attributes.append(
+                (apps_attrib_name, apps_scope, apps_attribute_data)
             )
 
         if not tools_matches:
-            await Postgres.execute(
-                """
-                UPDATE attributes SET
-                    scope = $1,
-                    data = $2
-                WHERE
-                    name = $3
-                """,
-                tools_scope,
-                tools_attribute_data,
-                tools_attrib_name,
+            changed_attributes.append(
+                (tools_attrib_name, tools_scope, tools_attribute_data)
             )
 
+        # Update all changed attributes in one query
+        values = []
+        query_args = []
+        for attribute_values in changed_attributes:
+            idx = len(query_args)
+            values.append(
+                f"(${idx + 1}, ${idx + 2}::varchar[], ${idx + 3}::jsonb)"
+            )
+            query_args.extend(attribute_values)
+
+        status = await Postgres.execute(
+            f"""
+            UPDATE attributes SET
+                scope = v.scope,
+                data = v.data
+            FROM (VALUES {", ".join(values)}) AS v(name, scope, data)
+            WHERE
+                attributes.name = v.name
+            """,
+            *query_args,
+        )
+
+        # Status of the query is 'UPDATE <rows count>', skip cache reset
+        #   if no attribute was updated
+        if status == "UPDATE 0":
+            return
+
         # Reset attributes cache on server
         await attribute_library.load()
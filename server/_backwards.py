@@ -11,15 +11,24 @@ TODO (Added 2024/08/05).
 Use this code when attributes are removed from the addon, or remove the
 file in future if plans changed.
 """
+import asyncio
+import functools
+
 import semver
 
 from ayon_server.addons import AddonLibrary
 from ayon_server.entities.core import attribute_library
 from ayon_server.lib.postgres import Postgres
 
+from .settings import iter_app_groups
+
 
 ATTRIBUTES_VERSION_MILESTONE = (1, 0, 0)
+# Used to compare scope of existing attributes
+APPS_SCOPE_SET = frozenset({"project"})
+TOOLS_SCOPE_SET = frozenset({"project", "folder", "task"})
 
+@functools.lru_cache(maxsize=None)
 def parse_version(version):
     try:
         return semver.VersionInfo.parse(version)
@@ -47,19 +56,24 @@ class ApplicationsLE_0_2:
     def _sort_versions(self, addon_versions, reverse=False):
         version_objs, invalid_versions = parse_versions(addon_versions)
 
-        valid_versions = [
-            addon_version
-            for addon_version, version_obj in (
-                sorted(version_objs, key=lambda x: x[1])
-            )
+        sorted_versions = [
+            (addon_version, None)
+            for addon_version in invalid_versions
+        ]
+        sorted_versions.extend(
+            (addon_version, version_obj)
+            for addon_version, version_obj in version_objs
             # Skip versions greater than 0.2
             if (version_obj.major, version_obj.minor) <= (0, 2)
-        ]
-        sorted_versions = list(sorted(invalid_versions)) + valid_versions
-        if reverse:
-            sorted_versions = reversed(sorted_versions)
-        for addon_version in sorted_versions:
-            yield addon_version
+        )
+        # Invalid versions are sorted by name before valid versions
+        sorted_versions.sort(
+            key=lambda item: (
+                (0, item[0]) if item[1] is None else (1, item[1])
+            ),
+            reverse=reverse,
+        )
+        return sorted_versions
 
     def _merge_groups(self, output, new_groups):
         groups_by_name = {
@@ -99,12 +113,11 @@ class ApplicationsLE_0_2:
                 label_by_name[full_name] = full_label
 
         return [
-            {"value": full_name, "label": label_by_name[full_name]}
-            for full_name in sorted(label_by_name)
+            {"value": full_name, "label": full_label}
+            for full_name, full_label in sorted(label_by_name.items())
         ]
 
-    def _addon_has_attributes(self, addon, addon_version):
-        version_obj = parse_version(addon_version)
+    def _addon_has_attributes(self, addon, version_obj):
         if version_obj is None or version_obj < ATTRIBUTES_VERSION_MILESTONE:
             return True
         return getattr(addon, "has_attributes", False)
@@ -118,25 +131,31 @@ class ApplicationsLE_0_2:
 
         instance = AddonLibrary.getinstance()
         app_defs = instance.data.get(self._addon_obj.name)
-        all_applications = []
-        all_tools = []
-        for addon_version in self._sort_versions(
+        addons = []
+        for addon_version, version_obj in self._sort_versions(
             app_defs.versions.keys(), reverse=True
         ):
             addon = app_defs.versions[addon_version]
-            if not self._addon_has_attributes(addon):
-                continue
+            if self._addon_has_attributes(addon, version_obj):
+                addons.append(addon)
 
-            for variant in ("production", "staging"):
-                settings_model = await addon.get_studio_settings(variant)
-                studio_settings = settings_model.dict()
-                application_settings = studio_settings["applications"]
-                app_groups = application_settings.pop("additional_apps")
-                for group_name, value in application_settings.items():
-                    value["name"] = group_name
-                    app_groups.append(value)
-                self._merge_groups(all_applications, app_groups)
-                self._merge_groups(all_tools, studio_settings["tool_groups"])
+        # Fetch settings concurrently, order of results is kept so newer
+        #   addon versions are still merged first
+        settings_models = await asyncio.gather(*(
+            addon.get_studio_settings(variant)
+            for addon in addons
+            for variant in ("production", "staging")
+        ))
+
+        all_applications = []
+        all_tools = []
+        for settings_model in settings_models:
+            studio_settings = settings_model.dict()
+            self._merge_groups(
+                all_applications,
+                iter_app_groups(studio_settings["applications"])
+            )
+            self._merge_groups(all_tools, studio_settings["tool_groups"])
 
         apps_attrib_name = "applications"
         tools_attrib_name = "tools"
@@ -161,20 +180,25 @@ class ApplicationsLE_0_2:
         apps_matches = False
         tools_matches = False
 
-        async for row in Postgres.iterate(
-            "SELECT name, position, scope, data from public.attributes"
+        for row in await Postgres.fetch(
+            """
+            SELECT name, scope, data
+            FROM public.attributes
+            WHERE name = ANY($1)
+            """,
+            [apps_attrib_name, tools_attrib_name],
         ):
             if row["name"] == apps_attrib_name:
                 # Check if scope is matching ftrack addon requirements
                 if (
-                    set(row["scope"]) == set(apps_scope)
+                    set(row["scope"]) == APPS_SCOPE_SET
                     and row["data"].get("enum") == apps_enum
                 ):
                     apps_matches = True
 
             elif row["name"] == tools_attrib_name:
                 if (
-                    set(row["scope"]) == set(tools_scope)
+                    set(row["scope"]) == TOOLS_SCOPE_SET
                     and row["data"].get("enum") == tools_enum
                 ):
                     tools_matches = True
@@ -182,33 +206,38 @@ class ApplicationsLE_0_2:
         if apps_matches and tools_matches:
             return
 
+        changed_attributes = []
         if not apps_matches:
-            await Postgres.execute(
-                """
-                UPDATE attributes SET
-                    scope = $1,
-                    data = $2
-                WHERE
-                    name = $3
-                """,
-                apps_scope,
-                apps_attribute_data,
-                apps_attrib_name,
+            changed_attributes.append(
+                (apps_attrib_name, apps_scope, apps_attribute_data)
             )
 
         if not tools_matches:
-            await Postgres.execute(
-                """
-                UPDATE attributes SET
-                    scope = $1,
-                    data = $2
-                WHERE
-                    name = $3
-                """,
-                tools_scope,
-                tools_attribute_data,
-                tools_attrib_name,
+            changed_attributes.append(
+                (tools_attrib_name, tools_scope, tools_attribute_data)
+            )
+
+        # Update all changed attributes in one query
+        values = []
+        query_args = []
+        for attribute_values in changed_attributes:
+            idx = len(query_args)
+            values.append(
+                f"(${idx + 1}, ${idx + 2}::varchar[], ${idx + 3}::jsonb)"
             )
+            query_args.extend(attribute_values)
+
+        await Postgres.execute(
+            f"""
+            UPDATE attributes SET
+                scope = v.scope,
+                data = v.data
+            FROM (VALUES {", ".join(values)}) AS v(name, scope, data)
+            WHERE
+                attributes.name = v.name
+            """,
+            *query_args,
+        )
 
         # Reset attributes cache on server
         await attribute_library.load()
@@ -1,6 +1,6 @@
+import asyncio
 import collections
 import os
-import copy
 
 from ayon_server.actions import SimpleActionManifest
 from ayon_server.entities import ProjectEntity
@@ -8,28 +8,38 @@ from ayon_server.entities import ProjectEntity
 from .constants import LABELS_BY_GROUP_NAME, ICONS_BY_GROUP_NAME
 
 IDENTIFIER_PREFIX = "application.launch."
+# Arguments shared by all application action manifests
+COMMON_MANIFEST_KWARGS = {
+    "category": "Applications",
+    "order": 100,
+    "entity_type": "task",
+    "allow_multiselection": False,
+}
+ICONS_URL_PREFIX = "{addon_url}/public/icons/"
+ICON_URL_BY_GROUP_NAME = {
+    group_name: ICONS_URL_PREFIX + os.path.basename(icon_name)
+    for group_name, icon_name in ICONS_BY_GROUP_NAME.items()
+}
 
 
 def get_items_for_app_groups(groups):
-    label_by_name = {}
-    icon_by_name = {}
+    label_icon_by_name = {}
     for group in groups:
         group_name = group["name"]
         group_label = group.get(
             "label", LABELS_BY_GROUP_NAME.get(group_name)
         ) or group_name
-        icon_name = ICONS_BY_GROUP_NAME.get(group_name)
-        if not icon_name:
+        icon_url = ICON_URL_BY_GROUP_NAME.get(group_name)
+        if not icon_url:
             icon_name = group.get("icon")
-
-        if icon_name:
-            icon_name = os.path.basename(icon_name)
+            if icon_name:
+                icon_url = ICONS_URL_PREFIX + os.path.basename(icon_name)
 
         icon = None
-        if icon_name:
+        if icon_url:
             icon = {
                 "type": "url",
-                "url": "{addon_url}/public/icons/" + icon_name,
+                "url": icon_url,
             }
 
         for variant in group["variants"]:
@@ -39,16 +49,17 @@ def get_items_for_app_groups(groups):
             variant_label = variant["label"] or variant_name
             full_name = f"{group_name}/{variant_name}"
             full_label = f"{group_label} {variant_label}"
-            label_by_name[full_name] = full_label
-            icon_by_name[full_name] = icon
+            label_icon_by_name[full_name] = (full_label, icon)
 
     return [
         {
             "value": full_name,
-            "label": label_by_name[full_name],
-            "icon": icon_by_name[full_name],
+            "label": full_label,
+            "icon": icon,
         }
-        for full_name in sorted(label_by_name)
+        for full_name, (full_label, icon) in sorted(
+            label_icon_by_name.items()
+        )
     ]
 
 
@@ -66,12 +77,9 @@ async def _get_action_manifests_with_attributes(app_groups, project_entity):
             SimpleActionManifest(
                 identifier=f"{IDENTIFIER_PREFIX}{app_full_name}",
                 label=item["label"],
-                category="Applications",
                 icon=item["icon"],
-                order=100,
-                entity_type="task",
                 entity_subtypes=None,
-                allow_multiselection=False,
+                **COMMON_MANIFEST_KWARGS,
             )
         )
     return output
@@ -81,18 +89,20 @@ async def get_action_manifests(addon, project_name, variant):
     if not project_name:
         return []
 
-    settings_model = await addon.get_studio_settings(variant=variant)
+    settings_model, project_entity = await asyncio.gather(
+        addon.get_studio_settings(variant=variant),
+        ProjectEntity.load(project_name),
+    )
     addon_settings = settings_model.dict()
 
     app_settings = addon_settings["applications"]
-    app_groups = app_settings.pop("additional_apps")
-    for group_name, value in app_settings.items():
-        if not value["enabled"]:
-            continue
-        value["name"] = group_name
-        app_groups.append(value)
+    app_groups = list(app_settings["additional_apps"])
+    app_groups.extend(
+        {**value, "name": group_name}
+        for group_name, value in app_settings.items()
+        if group_name != "additional_apps" and value["enabled"]
+    )
 
-    project_entity = await ProjectEntity.load(project_name)
     if not addon_settings["project_applications"]["enabled"]:
         output = await _get_action_manifests_with_attributes(
             app_groups, project_entity
@@ -101,23 +111,18 @@ async def get_action_manifests(addon, project_name, variant):
 
     # This is very simplified profiles logic
     app_items = get_items_for_app_groups(app_groups)
-    app_items_by_name = {
-        item["value"]: item
-        for item in app_items
-    }
     task_types_by_app_name = collections.defaultdict(set)
 
-    profiles = copy.deepcopy(
-        addon_settings["project_applications"]["profiles"]
-    )
+    profiles = addon_settings["project_applications"]["profiles"]
 
+    all_app_names = [item["value"] for item in app_items]
     generic_apps = None
     used_task_types = set()
     for profile in profiles:
         if profile["allow_type"] == "all_applications":
-            allowed_apps = list(app_items_by_name.keys())
+            allowed_apps = all_app_names
         else:
-            allowed_apps = list(profile["applications"])
+            allowed_apps = profile["applications"]
 
         if not profile["task_types"]:
             if generic_apps is None:
@@ -129,9 +134,9 @@ async def get_action_manifests(addon, project_name, variant):
             continue
 
         for app_name in allowed_apps:
-            task_types_by_app_name[app_name] |= task_types
+            task_types_by_app_name[app_name].update(task_types)
 
-        used_task_types |= task_types
+        used_task_types.update(task_types)
 
     project_task_types = {
         task_type["name"]
@@ -140,24 +145,21 @@ async def get_action_manifests(addon, project_name, variant):
     generic_task_types = project_task_types - used_task_types
     if generic_task_types and generic_apps:
         for app_name in generic_apps:
-            task_types_by_app_name[app_name] |= generic_task_types
+            task_types_by_app_name[app_name].update(generic_task_types)
 
     output = []
     for app_item in app_items:
         app_name = app_item["value"]
-        task_types = task_types_by_app_name[app_name]
+        task_types = task_types_by_app_name.get(app_name)
         if not task_types:
             continue
         output.append(
             SimpleActionManifest(
                 identifier=f"{IDENTIFIER_PREFIX}{app_name}",
                 label=app_item["label"],
-                category="Applications",
                 icon=app_item["icon"],
-                order=100,
-                entity_type="task",
                 entity_subtypes=list(task_types),
-                allow_multiselection=False,
+                **COMMON_MANIFEST_KWARGS,
             )
         )
     return output
@@ -1,5 +1,7 @@
 import os
 import json
+import logging
+import functools
 from pydantic import validator
 
 from ayon_server.addons import BaseServerAddon
@@ -11,13 +13,10 @@ from ayon_server.settings import (
 )
 from ayon_server.exceptions import BadRequestException
 
+log = logging.getLogger(__name__)
+
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
-ICONS_DIR = os.path.join(
-    os.path.dirname(CURRENT_DIR),
-    "public",
-    "icons"
-)
-DEFAULT_APP_GROUPS = {
+DEFAULT_APP_GROUPS = frozenset({
     "maya",
     "adsk_3dsmax",
     "flame",
@@ -49,7 +48,19 @@ DEFAULT_APP_GROUPS = {
     "terminal",
     "premiere",
     "mochapro",
-}
+})
+
+
+def _iter_variant_enum_items(group_name, group_label, variants):
+    label_prefix = f"{group_label} "
+    value_prefix = f"{group_name}/"
+    for variant in sorted(
+        variants, key=lambda x: x.label or x.name, reverse=True
+    ):
+        yield {
+            "label": label_prefix + (variant.label or variant.name),
+            "value": value_prefix + variant.name,
+        }
 
 
 async def applications_enum(
@@ -65,61 +76,40 @@ async def applications_enum(
         )
 
     apps_settings = settings.applications
-    apps_fields = apps_settings.__fields__
-    apps_groups = set(apps_fields.keys())
-    apps_groups.discard("additional_apps")
     all_variants_by_group_label = {}
-    for group_name in apps_groups:
+    for group_name, group_label in GROUP_LABEL_BY_NAME.items():
         app_group = getattr(apps_settings, group_name)
         # Skip disabled group
         if not app_group.enabled:
             continue
 
         # Skip group without variants
-        app_variants = list(app_group.variants)
-        if not app_variants:
+        if not app_group.variants:
             continue
 
-        app_field = apps_fields[group_name]
-        group_label = app_field.field_info.title
-
-        app_variants = list(app_group.variants)
-        app_variants.sort(key=lambda x: x.label or x.name, reverse=True)
-        enum_variants = all_variants_by_group_label.setdefault(
-            group_label, []
+        all_variants_by_group_label.setdefault(group_label, []).extend(
+            _iter_variant_enum_items(
+                group_name, group_label, app_group.variants
+            )
         )
-        enum_variants.extend([
-            {
-                "label": f"{group_label} {variant.label or variant.name}",
-                "value": f"{group_name}/{variant.name}",
-            }
-            for variant in app_variants
-        ])
 
     for additional_app in apps_settings.additional_apps:
         group_name = additional_app.name
         if not additional_app.enabled or not group_name:
             continue
 
-        app_variants = list(additional_app.variants)
-        if not app_variants:
+        if not additional_app.variants:
             continue
 
         group_label = additional_app.label
         if not group_label:
             group_label = group_name
 
-        app_variants.sort(key=lambda x: x.label or x.name, reverse=True)
-        enum_variants = all_variants_by_group_label.setdefault(
-            group_label, []
+        all_variants_by_group_label.setdefault(group_label, []).extend(
+            _iter_variant_enum_items(
+                group_name, group_label, additional_app.variants
+            )
         )
-        enum_variants.extend([
-            {
-                "label": f"{group_label} {variant.label or variant.name}",
-                "value": f"{group_name}/{variant.name}",
-            }
-            for variant in app_variants
-        ])
 
     all_variants = []
     for key, value in sorted(all_variants_by_group_label.items()):
@@ -153,23 +143,50 @@ async def tools_enum(
     return enum_variants
 
 
-def validate_json_dict(value):
-    if not value.strip():
-        return "{}"
+# Same environment strings are validated on each settings load
+@functools.lru_cache(maxsize=1024)
+def _is_json_dict(value):
     try:
         converted_value = json.loads(value)
-        success = isinstance(converted_value, dict)
+        return isinstance(converted_value, dict)
     except json.JSONDecodeError as exc:
-        print(exc)
-        success = False
+        log.debug("Failed to parse environment json: %s", exc)
+        return False
+
+
+def validate_json_dict(value):
+    # Default value of environment fields, skip parsing
+    if value == "{}":
+        return value
 
-    if not success:
+    # Use stripped value for cache lookup, whitespace around json
+    #   object does not change the result
+    stripped_value = value.strip()
+    if not stripped_value:
+        return "{}"
+
+    if not _is_json_dict(stripped_value):
         raise BadRequestException(
             "Environment's can't be parsed as json object"
         )
     return value
 
 
+def _ensure_unique_names(items):
+    # Names are unique in most cases, 'ensure_unique_names' is used to
+    #   raise the error when they're not
+    if len({item.name for item in items}) != len(items):
+        ensure_unique_names(items)
+
+
+def _validate_environment(cls, value):
+    return validate_json_dict(value)
+
+
+def environment_validator():
+    return validator("environment", allow_reuse=True)(_validate_environment)
+
+
 class MultiplatformStrList(BaseSettingsModel):
     windows: list[str] = SettingsField(default_factory=list, title="Windows")
     linux: list[str] = SettingsField(default_factory=list, title="Linux")
@@ -189,9 +206,7 @@ class AppVariant(BaseSettingsModel):
         "{}", title="Environment", widget="textarea"
     )
 
-    @validator("environment")
-    def validate_json(cls, value):
-        return validate_json_dict(value)
+    validate_json = environment_validator()
 
 
 class AppGroup(BaseSettingsModel):
@@ -210,7 +225,7 @@ class AppGroup(BaseSettingsModel):
 
     @validator("variants")
     def validate_unique_name(cls, value):
-        ensure_unique_names(value)
+        _ensure_unique_names(value)
         return value
 
 
@@ -233,7 +248,7 @@ class AdditionalAppGroup(BaseSettingsModel):
 
     @validator("variants")
     def validate_unique_name(cls, value):
-        ensure_unique_names(value)
+        _ensure_unique_names(value)
         return value
 
 
@@ -251,9 +266,7 @@ class ToolVariantModel(BaseSettingsModel):
         "{}", title="Environments", widget="textarea"
     )
 
-    @validator("environment")
-    def validate_json(cls, value):
-        return validate_json_dict(value)
+    validate_json = environment_validator()
 
 
 class ToolGroupModel(BaseSettingsModel):
@@ -264,13 +277,11 @@ class ToolGroupModel(BaseSettingsModel):
     )
     variants: list[ToolVariantModel] = SettingsField(default_factory=list)
 
-    @validator("environment")
-    def validate_json(cls, value):
-        return validate_json_dict(value)
+    validate_json = environment_validator()
 
     @validator("variants")
     def validate_unique_name(cls, value):
-        ensure_unique_names(value)
+        _ensure_unique_names(value)
         return value
 
 
@@ -344,13 +355,21 @@ class ApplicationsSettings(BaseSettingsModel):
 
     @validator("additional_apps")
     def validate_unique_name(cls, value):
-        ensure_unique_names(value)
+        _ensure_unique_names(value)
         for item in value:
             if item.name in DEFAULT_APP_GROUPS:
                 raise BadRequestException(f"Duplicate name '{item.name}'")
         return value
 
 
+# Labels of predefined application groups used in applications enum
+GROUP_LABEL_BY_NAME = {
+    field_name: field.field_info.title
+    for field_name, field in ApplicationsSettings.__fields__.items()
+    if field_name != "additional_apps"
+}
+
+
 def _get_allow_type():
     return [
         {"label": "All applications", "value": "all_applications"},
@@ -483,10 +502,22 @@ class ApplicationsAddonSettings(BaseSettingsModel):
 
     @validator("tool_groups")
     def validate_unique_name(cls, value):
-        ensure_unique_names(value)
+        _ensure_unique_names(value)
         return value
 
 
+def iter_app_groups(application_settings):
+    """Iterate application groups from applications settings.
+
+    Settings are not modified, group name is added to a copy of each
+    group that is defined by settings key.
+    """
+    yield from application_settings["additional_apps"]
+    for group_name, value in application_settings.items():
+        if group_name != "additional_apps":
+            yield {**value, "name": group_name}
+
+
 def _get_applications_defaults():
     with open(os.path.join(CURRENT_DIR, "applications.json"), "r") as stream:
         applications_defaults = json.load(stream)